@@ -0,0 +1,197 @@
+"""
+Shared MCP session for the examples
+
+Keeps a single SketchUp MCP client per process so that scripts (or a runner
+importing several of them) reuse one connection instead of reconnecting for
+every example.
+"""
+
+import atexit
+import base64
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import threading
+
+# Ruby code longer than this is sent gzip-compressed and base64 encoded
+COMPRESS_THRESHOLD = 2048
+GZ64_MARKER = "##gz64##"
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%H:%M:%S'
+
+# Ruby helpers shared by the example scripts, defined once per session
+PREAMBLE_RUBY_CODE = """
+module McpExamples
+  # Runs the block inside an undoable operation with UI updates disabled,
+  # yielding the model and its active entities
+  def self.with_op(name)
+    model = Sketchup.active_model
+    model.start_operation(name, true)
+    result = yield(model, model.active_entities)
+    model.commit_operation
+    result
+  rescue
+    model.abort_operation if model
+    raise
+  end
+end
+"""
+
+# Global logging and client management
+_logging_configured = False
+_client = None
+_primed = False
+_prime_lock = threading.Lock()
+
+# Digests of code that SketchUp has already compiled for this process
+_compiled_digests = set()
+
+class ResultFetchError(Exception):
+    """Raised when fetch_result cannot return a stashed result"""
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per second rather than per record"""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_second = None
+        self._cached_time = None
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+def get_logger(name):
+    """Get a logger for an example, configuring logging on first use"""
+    global _logging_configured
+
+    if not _logging_configured:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+        logging.basicConfig(level=logging.INFO, handlers=[handler])
+        _logging_configured = True
+
+    return logging.getLogger(name)
+
+def get_client():
+    """Get or create the shared SketchUp MCP client"""
+    global _client
+
+    if _client is None:
+        # Imported here so scripts only pay for the MCP client when they connect
+        from mcp.client import Client
+        _client = Client("sketchup")
+        atexit.register(close_client)
+
+    return _client
+
+def close_client():
+    """Close the shared client if one is open"""
+    global _client
+
+    if _client is not None:
+        close = getattr(_client, "close", None)
+        if close is not None:
+            close()
+        _client = None
+
+def ruby_string(text):
+    """Quote text as a Ruby string literal, escaping # so nothing is interpolated"""
+    return json.dumps(text, ensure_ascii=False).replace("#", "\\#")
+
+def fetch_result(client, result_id):
+    """Fetch and release a full result stashed in $MCP_RESULTS by an earlier script"""
+    response = client.eval_ruby(code=f"""
+results = $MCP_RESULTS || {{}}
+id = {ruby_string(result_id)}
+(results.key?(id) ? {{ "value" => results.delete(id) }} : {{}}).to_json
+""")
+    result = json.loads(response)
+    if not result.get("success"):
+        raise ResultFetchError(f"Failed to fetch result {result_id}: {result.get('error')}")
+    stashed = json.loads(result.get("result"))
+    if "value" not in stashed:
+        raise ResultFetchError(f"Unknown result {result_id}; it may have been fetched already")
+    return stashed["value"]
+
+def maybe_compress(code):
+    """Compress large Ruby code for eval_ruby.
+
+    The SketchUp extension (1.7.0 or later) inflates code starting with the
+    ##gz64## marker before evaluating it and reports inflated: true in the result.
+    Short snippets are returned unchanged.
+    """
+    if len(code) <= COMPRESS_THRESHOLD:
+        return code
+    return GZ64_MARKER + base64.b64encode(gzip.compress(code.encode("utf-8"))).decode("ascii")
+
+def eval_ruby(client, code):
+    """Evaluate Ruby code through the client, letting SketchUp cache it by digest.
+
+    The first call sends the code together with its SHA-256 digest. Later calls
+    with the same code send only the digest, falling back to the full code if
+    SketchUp no longer has it cached. The first script of the session that uses
+    McpExamples also carries PREAMBLE_RUBY_CODE, so the shared helpers cost no
+    extra round-trip and scripts that don't use them never wait on it.
+    """
+    global _primed
+
+    if not _primed and "McpExamples" in code:
+        # Concurrent callers wait here so only one of them sends the preamble
+        with _prime_lock:
+            if not _primed:
+                response = _eval_ruby_cached(client, PREAMBLE_RUBY_CODE + code)
+                if _parse_response(response).get("success"):
+                    _primed = True
+                return response
+
+    return _eval_ruby_cached(client, code)
+
+def _eval_ruby_cached(client, code):
+    """Send code by digest when SketchUp has it compiled, in full otherwise"""
+    code_sha, payload = _prepare_code(code)
+
+    if code_sha in _compiled_digests:
+        response = client.eval_ruby(code_sha=code_sha)
+        if _parse_response(response).get("error_code") != "unknown_code_sha":
+            return response
+        _compiled_digests.discard(code_sha)
+
+    response = client.eval_ruby(code=payload, code_sha=code_sha)
+    result = _parse_response(response)
+    if payload.startswith(GZ64_MARKER) and result.get("success") and not result.get("inflated"):
+        # Extensions older than 1.7.0 read the compressed payload as one comment
+        # line, so nothing ran; report that as a failed call
+        return json.dumps({
+            "success": False,
+            "error": "Compressed Ruby code was not inflated; the SketchUp MCP extension 1.7.0 or later is required"
+        })
+    if result.get("success"):
+        _compiled_digests.add(code_sha)
+    return response
+
+@functools.lru_cache(maxsize=32)
+def _prepare_code(code):
+    """Return the digest and wire payload for code, computed once per distinct script"""
+    return hashlib.sha256(code.encode("utf-8")).hexdigest(), maybe_compress(code)
+
+@functools.lru_cache(maxsize=128)
+def parse_response(response):
+    """Parse a JSON response, reusing the result for identical responses.
+
+    The parsed objects are shared between callers, so don't modify them.
+    """
+    return json.loads(response)
+
+def _parse_response(response):
+    """Parse an eval_ruby response, treating anything unparseable as empty"""
+    try:
+        return parse_response(response)
+    except json.JSONDecodeError:
+        return {}
@@ -0,0 +1,253 @@
+# Arts and Crafts Cabinet with Working Doors
+# This script creates a stylish arts and crafts style cabinet with working doors
+# that can be opened and closed using SketchUp's component functionality
+
+def create_arts_and_crafts_cabinet
+  # Build the cabinet inside an undoable operation
+  instance = McpExamples.with_op("Create Arts and Crafts Cabinet") do |model, active_entities|
+    # Define cabinet dimensions (in inches)
+    width = 36
+    depth = 18
+    height = 72
+    thickness = 0.75
+    
+    # Create a new component definition for the cabinet
+    cabinet_def = model.definitions.add("Arts and Crafts Cabinet")
+    entities = cabinet_def.entities
+    
+    # Each part below is built as its own group, so adding its faces only
+    # touches that group's entities rather than the whole cabinet
+    
+    # Create the main cabinet box
+    create_cabinet_box(entities, width, depth, height, thickness)
+    
+    # Add shelves
+    shelf_positions = [height/3, 2*height/3]
+    create_shelves(entities, width, depth, thickness, shelf_positions)
+    
+    # Add decorative elements typical of arts and crafts style
+    add_decorative_elements(entities, width, depth, height, thickness)
+    
+    # Create doors (as nested components that can swing open)
+    create_doors(entities, model.definitions, width, depth, height, thickness)
+    
+    # Place the component in the model
+    point = Geom::Point3d.new(0, 0, 0)
+    transform = Geom::Transformation.new(point)
+    active_entities.add_instance(cabinet_def, transform)
+  end
+  
+  # Redraw once for the whole cabinet now the operation is committed
+  Sketchup.active_model.active_view.invalidate
+  
+  # Return the component instance ID
+  return instance.entityID
+end
+
+# Returns the six outward facing quads of the box spanning min to max
+def box_faces(min, max)
+  x0, y0, z0 = min
+  x1, y1, z1 = max
+  [
+    [[x0, y0, z0], [x0, y1, z0], [x1, y1, z0], [x1, y0, z0]], # bottom
+    [[x0, y0, z1], [x1, y0, z1], [x1, y1, z1], [x0, y1, z1]], # top
+    [[x0, y0, z0], [x1, y0, z0], [x1, y0, z1], [x0, y0, z1]], # front
+    [[x1, y0, z0], [x1, y1, z0], [x1, y1, z1], [x1, y0, z1]], # right
+    [[x1, y1, z0], [x0, y1, z0], [x0, y1, z1], [x1, y1, z1]], # back
+    [[x0, y1, z0], [x0, y0, z0], [x0, y0, z1], [x0, y1, z1]]  # left
+  ]
+end
+
+# Adds a solid box to the builder (the builder has no pushpull)
+def add_box(builder, min, max)
+  box_faces(min, max).each { |points| builder.add_face(points) }
+end
+
+# Adds a solid box to the mesh. Points are added before the polygon so that
+# de-duplication stays cheap on SketchUp versions before 2021.1.
+def add_box_to_mesh(mesh, min, max)
+  box_faces(min, max).each do |points|
+    mesh.add_polygon(points.map { |point| mesh.add_point(Geom::Point3d.new(point)) })
+  end
+end
+
+# Creates a named group filled from the polygon mesh built in the block.
+# fill_from_mesh welds vertices but skips merging and splitting, and the new
+# group's entities are always empty as fill_from_mesh requires.
+def add_mesh_group(entities, name, flags = Geom::PolygonMesh::AUTO_SOFTEN)
+  mesh = Geom::PolygonMesh.new
+  yield mesh
+  group = entities.add_group
+  group.name = name
+  group.entities.fill_from_mesh(mesh, true, flags)
+  group
+end
+
+def create_cabinet_box(entities, width, depth, height, thickness)
+  add_mesh_group(entities, "Cabinet Box") do |mesh|
+    # Bottom
+    add_box_to_mesh(mesh, [0, 0, 0], [width, depth, thickness])
+  
+    # Back
+    add_box_to_mesh(mesh, [0, depth, 0], [width, depth + thickness, height])
+  
+    # Left side
+    add_box_to_mesh(mesh, [-thickness, 0, 0], [0, depth, height])
+  
+    # Right side
+    add_box_to_mesh(mesh, [width, 0, 0], [width + thickness, depth, height])
+  
+    # Top
+    add_box_to_mesh(mesh, [0, 0, height], [width, depth, height + thickness])
+  end
+end
+
+def create_shelves(entities, width, depth, thickness, positions)
+  add_mesh_group(entities, "Shelves") do |mesh|
+    positions.each do |z_pos|
+      add_box_to_mesh(mesh,
+        [thickness, thickness, z_pos - thickness],
+        [width - thickness, depth - thickness, z_pos])
+    end
+  end
+end
+
+def create_doors(entities, definitions, width, depth, height, thickness)
+  # Define door dimensions
+  door_width = (width - thickness) / 2
+  door_height = height - 2 * thickness
+  
+  # Both doors share the same panel and handle, so build them once and
+  # place an instance of the details in each door
+  door_details_def = definitions.add("Door Details")
+  add_door_details(door_details_def.entities, door_width, thickness, door_height)
+  
+  # Create left door as a component (so it can be animated)
+  left_door_def = definitions.add("Left Cabinet Door")
+  
+  # Create the door geometry in the component and add the details
+  left_door_def.entities.build do |builder|
+    add_box(builder, [0, 0, 0], [door_width, thickness, door_height])
+  end
+  left_door_def.entities.add_instance(door_details_def, Geom::Transformation.new)
+  
+  # Place the left door component
+  left_hinge_point = Geom::Point3d.new(thickness, thickness, thickness)
+  left_transform = Geom::Transformation.new(left_hinge_point)
+  left_door_instance = entities.add_instance(left_door_def, left_transform)
+  
+  # Set the hinge axis for animation - using correct method for SketchUp 2025
+  # The component behavior is already set by default
+  left_door_instance.definition.behavior.snapto = 0 # No automatic snapping
+  
+  # Create right door (similar process)
+  right_door_def = definitions.add("Right Cabinet Door")
+  
+  right_door_def.entities.build do |builder|
+    add_box(builder, [0, 0, 0], [door_width, thickness, door_height])
+  end
+  right_door_def.entities.add_instance(door_details_def, Geom::Transformation.new)
+  
+  # Place the right door component
+  right_hinge_point = Geom::Point3d.new(width - thickness, thickness, thickness)
+  right_transform = Geom::Transformation.new(right_hinge_point)
+  right_door_instance = entities.add_instance(right_door_def, right_transform)
+  
+  # Set the hinge axis for animation (flipped compared to left door)
+  # The component behavior is already set by default
+  right_door_instance.definition.behavior.snapto = 0
+end
+
+def add_door_details(entities, width, thickness, height)
+  # Add a decorative panel that's inset
+  inset = thickness / 2
+  add_mesh_group(entities, "Panel") do |mesh|
+    add_box_to_mesh(mesh,
+      [inset, -thickness/2, inset],
+      [width - inset, -thickness/4, height - inset])
+  end
+  
+  # Add a small handle: a 12 sided cylinder given as explicit end caps and
+  # side quads, with the sides smoothed
+  segments = 12
+  handle_x = width - 2 * inset
+  handle_z = height / 2
+  handle_size = height / 20
+  smooth = Geom::PolygonMesh::AUTO_SOFTEN | Geom::PolygonMesh::SMOOTH_SOFT_EDGES
+  add_mesh_group(entities, "Handle", smooth) do |mesh|
+    ring = lambda do |y|
+      (0...segments).map do |i|
+        angle = 2 * Math::PI * i / segments
+        point = Geom::Point3d.new(handle_x + handle_size * Math.cos(angle), y, handle_z + handle_size * Math.sin(angle))
+        mesh.add_point(point)
+      end
+    end
+    back_ring = ring.call(-thickness * 1.5)
+    front_ring = ring.call(-thickness * 2.5)
+    
+    mesh.add_polygon(back_ring.reverse)
+    mesh.add_polygon(front_ring)
+    segments.times do |i|
+      j = (i + 1) % segments
+      mesh.add_polygon([back_ring[i], back_ring[j], front_ring[j], front_ring[i]])
+    end
+  end
+end
+
+def add_decorative_elements(entities, width, depth, height, thickness)
+  add_mesh_group(entities, "Base") do |mesh|
+    # Add characteristic arts and crafts style base
+    base_height = 4
+  
+    # Create a slightly wider base
+    base_extension = 1
+    add_box_to_mesh(mesh,
+      [-base_extension, -base_extension, 0],
+      [width + base_extension, depth + base_extension, base_height])
+  end
+
+  # Add corbels in the arts and crafts style
+  add_corbels(entities, width, depth, height, thickness)
+  
+  # Add crown detail at the top
+  add_crown(entities, width, depth, height, thickness)
+end
+
+def add_corbels(entities, width, depth, height, thickness)
+  add_mesh_group(entities, "Corbels") do |mesh|
+    # Add decorative corbels under the top
+    corbel_height = 3
+    corbel_depth = 2
+  
+    # Left front corbel
+    add_box_to_mesh(mesh,
+      [thickness * 2, thickness, height - thickness - corbel_height],
+      [thickness * 2 + corbel_depth, thickness * 2, height - thickness])
+  
+    # Right front corbel
+    add_box_to_mesh(mesh,
+      [width - thickness * 2 - corbel_depth, thickness, height - thickness - corbel_height],
+      [width - thickness * 2, thickness * 2, height - thickness])
+  end
+end
+
+def add_crown(entities, width, depth, height, thickness)
+  add_mesh_group(entities, "Crown") do |mesh|
+    # Add a simple crown molding at the top
+    crown_height = 2
+    crown_extension = 1.5
+    crown_base = height + thickness
+  
+    add_box_to_mesh(mesh,
+      [-crown_extension, -crown_extension, crown_base],
+      [width + crown_extension, depth + crown_extension, crown_base + crown_height])
+  
+    # Add a slight taper to the crown
+    add_box_to_mesh(mesh,
+      [-crown_extension/2, -crown_extension/2, crown_base + crown_height],
+      [width + crown_extension/2, depth + crown_extension/2, crown_base + crown_height + crown_height/2])
+  end
+end
+
+# Execute the function to create the cabinet
+create_arts_and_crafts_cabinet
@@ -6,85 +6,99 @@ This script specifically tests the component behavior methods in SketchUp 25.0.5
 """
 
 import json
-import logging
-from mcp.client import Client
+import sys
+from _mcp_session import ResultFetchError, eval_ruby, fetch_result, get_client, get_logger
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("BehaviorTester")
+logger = get_logger("BehaviorTester")
 
 # Ruby code to test component behavior methods
 BEHAVIOR_TEST_CODE = """
-# Create a new model context
-model = Sketchup.active_model
-model.start_operation("Test Component Behavior", true)
-
-# Create a new component definition
-definition = model.definitions.add("Test Component")
-
-# Get the behavior object
-behavior = definition.behavior
-
-# Get all methods available on the behavior object
-all_methods = behavior.methods - Object.methods
-
-# Test setting various behavior properties
-results = {}
-
-# Test common behavior properties
-properties_to_test = [
-  "snapto",
-  "cuts_opening",
-  "always_face_camera",
-  "no_scale_tool",
-  "shadows_face_sun",
-  "is_component",
-  "component?"
-]
-
-# Test each property
-property_results = {}
-for prop in properties_to_test
-  begin
-    # Try to get the property
-    if behavior.respond_to?(prop)
-      property_results[prop] = {
-        "exists": true,
-        "readable": true
-      }
+require 'set'
+require 'securerandom'
+
+# Probe the behavior inside an undoable operation
+all_methods, property_results = McpExamples.with_op("Test Component Behavior") do |model, entities|
+  # Create a new component definition
+  definition = model.definitions.add("Test Component")
+
+  # Get the behavior object
+  behavior = definition.behavior
+
+  # Get all methods available on the behavior object
+  all_methods = behavior.methods - Object.methods
+
+  # Build the method lookups once instead of calling respond_to? per property
+  method_set = all_methods.to_set
+  setter_set = method_set.select { |m| m.to_s.end_with?("=") }.to_set
+
+  # Test setting various behavior properties
+  results = {}
+
+  # Test common behavior properties
+  properties_to_test = [
+    "snapto",
+    "cuts_opening",
+    "always_face_camera",
+    "no_scale_tool",
+    "shadows_face_sun",
+    "is_component",
+    "component?"
+  ]
+
+  # Test each property
+  property_results = {}
+  for prop in properties_to_test
+    begin
+      # Try to get the property
+      if method_set.include?(prop.to_sym)
+        property_results[prop] = {
+          "exists": true,
+          "readable": true
+        }
       
-      # Try to set the property (for boolean properties, try setting to true)
-      setter_method = prop + "="
-      if behavior.respond_to?(setter_method)
-        if prop == "snapto"
-          behavior.send(setter_method, 0)
+        # Try to set the property (for boolean properties, try setting to true)
+        setter_method = prop + "="
+        if setter_set.include?(setter_method.to_sym)
+          if prop == "snapto"
+            behavior.send(setter_method, 0)
+          else
+            behavior.send(setter_method, true)
+          end
+          property_results[prop]["writable"] = true
         else
-          behavior.send(setter_method, true)
+          property_results[prop]["writable"] = false
         end
-        property_results[prop]["writable"] = true
       else
-        property_results[prop]["writable"] = false
+        property_results[prop] = {
+          "exists": false
+        }
       end
-    else
+    rescue => e
       property_results[prop] = {
-        "exists": false
+        "exists": true,
+        "error": e.message
       }
     end
-  rescue => e
-    property_results[prop] = {
-      "exists": true,
-      "error": e.message
-    }
   end
+
+  [all_methods, property_results]
 end
 
-# End the operation
-model.commit_operation
+# Keep the full method list in SketchUp and only return a handle to it,
+# replacing any list an earlier run left behind
+all_methods = all_methods.sort
+$MCP_RESULTS ||= {}
+$MCP_RESULTS.delete_if { |key, _| key.start_with?("behavior_methods:") }
+result_id = "behavior_methods:#{SecureRandom.uuid}"
+$MCP_RESULTS[result_id] = all_methods
 
 # Return the results
 {
-  "all_methods": all_methods.sort,
+  "all_methods": {
+    "id": result_id,
+    "count": all_methods.size,
+    "sample": all_methods.first(10)
+  },
   "property_results": property_results
 }.to_json
 """
@@ -92,18 +106,16 @@ model.commit_operation
 def main():
     """Main function to test component behavior methods."""
     # Connect to the MCP server
-    client = Client("sketchup")
-    
-    # Check if the connection is successful
-    if not client.is_connected:
-        logger.error("Failed to connect to the SketchUp MCP server.")
-        return
-    
-    logger.info("Connected to SketchUp MCP server.")
+    client = get_client()
     
     # Run the behavior test
     logger.info("Testing component behavior methods...")
-    response = client.eval_ruby(code=BEHAVIOR_TEST_CODE)
+    # The first call also tells us whether the server is reachable
+    try:
+        response = eval_ruby(client, BEHAVIOR_TEST_CODE)
+    except ConnectionError:
+        logger.error("Failed to connect to the SketchUp MCP server.")
+        return
     
     # Parse the response
     try:
@@ -112,10 +124,19 @@ def main():
             # Parse the JSON result
             behavior_data = json.loads(result.get("result"))
             
-            # Display all available methods
-            logger.info("Available methods on Behavior object:")
-            for method in behavior_data["all_methods"]:
-                logger.info(f"  - {method}")
+            # Display the available methods, fetching the full list only on request
+            methods = behavior_data["all_methods"]
+            method_names = methods["sample"]
+            if "--all-methods" in sys.argv:
+                try:
+                    method_names = fetch_result(client, methods["id"])
+                except ResultFetchError as e:
+                    logger.error(f"Could not fetch the full method list: {e}")
+            lines = [f"Available methods on Behavior object ({methods['count']}):"]
+            lines.extend(f"  - {method}" for method in method_names)
+            if len(method_names) < methods["count"]:
+                lines.append(f"  ... {methods['count'] - len(method_names)} more (run with --all-methods to list them)")
+            logger.info("\n".join(lines))
             
             # Display property test results
             logger.info("\nProperty test results:")
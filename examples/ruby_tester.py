@@ -6,13 +6,16 @@ This script tests Ruby code in smaller chunks to identify compatibility issues w
 """
 
 import json
-import logging
-from mcp.client import Client
+from _mcp_session import eval_ruby, get_client, get_logger, parse_response, ruby_string
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("RubyTester")
+logger = get_logger("RubyTester")
+
+# Ruby run before the test cases to remove test definitions left by earlier runs
+SETUP_CODE = """
+Sketchup.active_model.definitions.tap do |definitions|
+  definitions.to_a.select { |d| d.name.start_with?("Test ") }.each { |d| definitions.remove(d) }
+end
+"""
 
 # Test cases - each with a name and Ruby code to test
 TEST_CASES = [
@@ -53,7 +56,7 @@ TEST_CASES = [
         "name": "Component Definition",
         "code": """
             model = Sketchup.active_model
-            definition = model.definitions.add("Test Component")
+            definition = model.definitions["Test Component"] || model.definitions.add("Test Component")
             definition.name
         """
     },
@@ -61,7 +64,7 @@ TEST_CASES = [
         "name": "Component Behavior",
         "code": """
             model = Sketchup.active_model
-            definition = model.definitions.add("Test Component")
+            definition = model.definitions["Test Component"] || model.definitions.add("Test Component")
             # Get behavior properties
             behavior = definition.behavior
             
@@ -77,7 +80,7 @@ TEST_CASES = [
         "code": """
             model = Sketchup.active_model
             entities = model.active_entities
-            definition = model.definitions.add("Test Component")
+            definition = model.definitions["Test Component"] || model.definitions.add("Test Component")
             
             # Create a point and transformation
             point = Geom::Point3d.new(0, 0, 0)
@@ -95,43 +98,71 @@ TEST_CASES = [
     }
 ]
 
-def test_ruby_code(client, test_case):
-    """Test a single Ruby code snippet."""
-    logger.info(f"Testing: {test_case['name']}")
-    
-    response = client.eval_ruby(code=test_case["code"])
-    
-    try:
-        result = json.loads(response)
-        if result.get("success"):
-            logger.info(f"✅ SUCCESS: {result.get('result')}")
-            return True
+def build_batched_code(test_cases):
+    """Combine the test cases into one Ruby script returning a JSON array of results.
+
+    Each case is embedded as a string and evaluated on its own, so a case that
+    fails to parse or raises a ScriptError only fails that case. The setup runs
+    the same way and only adds a "Setup" entry to the results if it fails.
+    """
+    parts = [f"""
+results = []
+begin
+  eval({ruby_string(SETUP_CODE)}, TOPLEVEL_BINDING.dup)
+rescue ScriptError, StandardError => e
+  results << {{ "name" => "Setup", "ok" => false, "error" => e.message }}
+end
+"""]
+    for test_case in test_cases:
+        name = ruby_string(test_case["name"])
+        code = ruby_string(test_case["code"])
+        parts.append(f"""
+results << begin
+  value = eval({code}, TOPLEVEL_BINDING.dup)
+  {{ "name" => {name}, "ok" => true, "result" => value.to_s }}
+rescue ScriptError, StandardError => e
+  {{ "name" => {name}, "ok" => false, "error" => e.message }}
+end
+""")
+    parts.append("results.to_json")
+    return "\n".join(parts)
+
+def report_results(results):
+    """Log each test result and return the number of successes."""
+    success_count = 0
+    for test_result in results:
+        logger.info(f"Testing: {test_result['name']}")
+        if test_result.get("ok"):
+            logger.info(f"✅ SUCCESS: {test_result.get('result')}")
+            success_count += 1
         else:
-            logger.error(f"❌ ERROR: {result.get('error')}")
-            return False
-    except json.JSONDecodeError:
-        logger.error(f"Failed to parse response: {response}")
-        return False
+            logger.error(f"❌ ERROR: {test_result.get('error')}")
+        logger.info("-" * 50)
+    return success_count
 
 def main():
     """Main function to test Ruby code snippets."""
     # Connect to the MCP server
-    client = Client("sketchup")
+    client = get_client()
+    logger.info("=" * 50)
     
-    # Check if the connection is successful
-    if not client.is_connected:
+    # Run all test cases in a single round-trip, which also tells us
+    # whether the server is reachable
+    try:
+        response = eval_ruby(client, build_batched_code(TEST_CASES))
+    except ConnectionError:
         logger.error("Failed to connect to the SketchUp MCP server.")
         return
     
-    logger.info("Connected to SketchUp MCP server.")
-    logger.info("=" * 50)
-    
-    # Run each test case
     success_count = 0
-    for test_case in TEST_CASES:
-        if test_ruby_code(client, test_case):
-            success_count += 1
-        logger.info("-" * 50)
+    try:
+        result = parse_response(response)
+        if result.get("success"):
+            success_count = report_results(json.loads(result.get("result")))
+        else:
+            logger.error(f"❌ ERROR: {result.get('error')}")
+    except json.JSONDecodeError:
+        logger.error(f"Failed to parse response: {response}")
     
     # Summary
     logger.info(f"Testing complete: {success_count}/{len(TEST_CASES)} tests passed")
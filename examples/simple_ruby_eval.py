@@ -6,14 +6,11 @@ This example demonstrates the basic usage of the eval_ruby feature
 to execute Ruby code in SketchUp.
 """
 
+import asyncio
 import json
-import logging
-from mcp.client import Client
+from _mcp_session import eval_ruby, get_client, get_logger, parse_response
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("SimpleRubyEvalExample")
+logger = get_logger("SimpleRubyEvalExample")
 
 # Simple Ruby code examples
 EXAMPLES = [
@@ -44,6 +41,8 @@ EXAMPLES = [
     },
     {
         "name": "Get model information",
+        # Counts the entities the other examples create, so it runs after them
+        "reads_model": True,
         "code": """
             model = Sketchup.active_model
             info = {
@@ -58,28 +57,46 @@ EXAMPLES = [
     }
 ]
 
+async def run_examples(client):
+    """Send the independent examples at once rather than waiting for each reply in turn.
+
+    The calls share one client from worker threads, so the client must allow
+    concurrent eval_ruby calls; the SketchUp side still evaluates them one at a
+    time as they arrive.
+    """
+    responses = [None] * len(EXAMPLES)
+    
+    # Examples that read the model run only after the ones changing it are done
+    for reads_model in (False, True):
+        indices = [i for i, example in enumerate(EXAMPLES) if example.get("reads_model", False) == reads_model]
+        tasks = [asyncio.to_thread(eval_ruby, client, EXAMPLES[i]["code"]) for i in indices]
+        for i, response in zip(indices, await asyncio.gather(*tasks, return_exceptions=True)):
+            responses[i] = response
+    
+    return responses
+
 def main():
     """Main function to demonstrate the eval_ruby feature."""
     # Connect to the MCP server
-    client = Client("sketchup")
-    
-    # Check if the connection is successful
-    if not client.is_connected:
-        logger.error("Failed to connect to the SketchUp MCP server.")
-        return
+    client = get_client()
     
-    logger.info("Connected to SketchUp MCP server.")
+    # Run the examples, concurrently where they don't depend on each other
+    logger.info(f"Running {len(EXAMPLES)} examples...")
+    responses = asyncio.run(run_examples(client))
     
-    # Run each example
-    for example in EXAMPLES:
-        logger.info(f"Running example: {example['name']}")
+    for example, response in zip(EXAMPLES, responses):
+        logger.info(f"Example: {example['name']}")
         
-        # Evaluate the Ruby code
-        response = client.eval_ruby(code=example["code"])
+        # Bail out if the server is unreachable
+        if isinstance(response, ConnectionError):
+            logger.error("Failed to connect to the SketchUp MCP server.")
+            return
+        if isinstance(response, BaseException):
+            raise response
         
         # Parse the response
         try:
-            result = json.loads(response)
+            result = parse_response(response)
             if result.get("success"):
                 logger.info(f"Result: {result.get('result')}")
             else:
@@ -6,58 +6,46 @@ This is a minimal test to verify that the eval_ruby feature works correctly.
 """
 
 import json
-import logging
-from mcp.client import Client
+from _mcp_session import eval_ruby, get_client, get_logger
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-logger = logging.getLogger("SimpleRubyTest")
+logger = get_logger("SimpleRubyTest")
 
 # Simple Ruby code to create a cube
 CUBE_CODE = """
-model = Sketchup.active_model
-entities = model.active_entities
-
-# Start an operation for undo
-model.start_operation("Create Test Cube", true)
-
-# Create a group for the cube
-group = entities.add_group
-
-# Create the bottom face
-face = group.entities.add_face(
-  [0, 0, 0],
-  [10, 0, 0],
-  [10, 10, 0],
-  [0, 10, 0]
-)
-
-# Push/pull to create the cube
-face.pushpull(10)
-
-# End the operation
-model.commit_operation
-
-# Return the group ID
-group.entityID.to_s
+# Create the cube inside an undoable operation
+McpExamples.with_op("Create Test Cube") do |model, entities|
+  # Create a group for the cube
+  group = entities.add_group
+  
+  # Create the bottom face
+  face = group.entities.add_face(
+    [0, 0, 0],
+    [10, 0, 0],
+    [10, 10, 0],
+    [0, 10, 0]
+  )
+  
+  # Push/pull to create the cube
+  face.pushpull(10)
+  
+  # Return the group ID
+  group.entityID.to_s
+end
 """
 
 def main():
     """Main function to test the eval_ruby feature."""
     # Connect to the MCP server
-    client = Client("sketchup")
-    
-    # Check if the connection is successful
-    if not client.is_connected:
-        logger.error("Failed to connect to the SketchUp MCP server.")
-        return
-    
-    logger.info("Connected to SketchUp MCP server.")
+    client = get_client()
     
     # Evaluate the Ruby code
     logger.info("Creating a simple cube...")
-    response = client.eval_ruby(code=CUBE_CODE)
+    # The first call also tells us whether the server is reachable
+    try:
+        response = eval_ruby(client, CUBE_CODE)
+    except ConnectionError:
+        logger.error("Failed to connect to the SketchUp MCP server.")
+        return
     
     # Parse the response
     try:
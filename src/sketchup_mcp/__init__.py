@@ -1,6 +1,6 @@
 """Sketchup integration through Model Context Protocol"""
 
-__version__ = "0.1.17"
+__version__ = "0.1.18"
 
 # Expose key classes and functions for easier imports
 from .server import mcp 
\ No newline at end of file
@@ -13,7 +13,7 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger("SketchupMCPServer")
 
 # Define version directly to avoid pkg_resources dependency
-__version__ = "0.1.17"
+__version__ = "0.1.18"
 logger.info(f"SketchupMCP Server version {__version__} starting up")
 
 @dataclass
@@ -538,32 +538,50 @@ def create_finger_joint(
 @mcp.tool()
 def eval_ruby(
     ctx: Context,
-    code: str
+    code: str = "",
+    code_sha: str = None
 ) -> str:
-    """Evaluate arbitrary Ruby code in Sketchup"""
+    """Evaluate arbitrary Ruby code in Sketchup
+
+    When code_sha (the SHA-256 hex digest of the code) is given, Sketchup
+    caches the compiled code under it, and later calls may send code_sha alone.
+    """
     try:
-        logger.info(f"eval_ruby called with code length: {len(code)}")
+        logger.info(f"eval_ruby called with code length: {len(code)}, code_sha: {code_sha}")
         
         sketchup = get_sketchup_connection()
         
+        arguments = {"code": code}
+        if code_sha is not None:
+            arguments["code_sha"] = code_sha
+        
         result = sketchup.send_command(
             method="tools/call",
             params={
                 "name": "eval_ruby",
-                "arguments": {
-                    "code": code
-                }
+                "arguments": arguments
             },
             request_id=ctx.request_id
         )
         
         logger.info(f"eval_ruby result: {result}")
         
+        # Expected failures (such as an uncached code_sha) come back as a
+        # normal result carrying an error code
+        if result.get("errorCode"):
+            return json.dumps({
+                "success": False,
+                "error": result.get("content", [{}])[0].get("text", ""),
+                "error_code": result["errorCode"]
+            })
+        
         # Format the response to include the result
         response = {
             "success": True,
             "result": result.get("content", [{"text": "Success"}])[0].get("text", "Success") if isinstance(result.get("content"), list) and len(result.get("content", [])) > 0 else "Success"
         }
+        if result.get("inflated"):
+            response["inflated"] = True
         
         return json.dumps(response)
     except Exception as e:
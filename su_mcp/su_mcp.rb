@@ -5,7 +5,7 @@ module SU_MCP
   unless file_loaded?(__FILE__)
     ext = SketchupExtension.new('Sketchup MCP Server', 'su_mcp/main')
     ext.description = 'Model Context Protocol server for Sketchup'
-    ext.version     = '1.5.0'
+    ext.version     = '1.7.0'
     ext.copyright   = '2024'
     ext.creator     = 'MCP Team'
     
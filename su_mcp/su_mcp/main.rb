@@ -2,6 +2,8 @@ require 'sketchup'
 require 'json'
 require 'socket'
 require 'fileutils'
+require 'zlib'
+require 'digest'
 
 puts "MCP Extension loading..."
 SKETCHUP_CONSOLE.show rescue nil
@@ -260,8 +262,25 @@ module SU_MCP
             },
             id: request["id"]
           }
+          # Let the client confirm a ##gz64## payload was inflated, not ignored
+          response[:result][:inflated] = true if result[:inflated]
           log "Sending success response: #{response.inspect}"
           response
+        elsif result[:error_code]
+          # Expected failures the caller can act on are sent as a normal
+          # result, so the client doesn't treat them as a broken connection
+          response = {
+            jsonrpc: request["jsonrpc"] || "2.0",
+            result: {
+              content: [{ type: "text", text: result[:error] }],
+              isError: true,
+              success: false,
+              errorCode: result[:error_code]
+            },
+            id: request["id"]
+          }
+          log "Sending failure result: #{response.inspect}"
+          response
         else
           response = {
             jsonrpc: request["jsonrpc"] || "2.0",
@@ -1823,22 +1842,70 @@ module SU_MCP
       }
     end
     
+    # Marker for code sent gzip-compressed and base64 encoded
+    GZ64_MARKER = "##gz64##"
+
+    def decode_ruby_code(code)
+      return code unless code.start_with?(GZ64_MARKER)
+      
+      compressed = code[GZ64_MARKER.length..-1].unpack1("m")
+      Zlib.gunzip(compressed).force_encoding(Encoding::UTF_8)
+    end
+    
+    # Number of compiled scripts kept by compile_ruby_code
+    PROC_CACHE_SIZE = 64
+
+    def proc_cache
+      @proc_cache ||= {}
+    end
+    
+    # Compile code into a lambda cached by the SHA-256 of its source, so
+    # repeated scripts skip parsing. Code may be omitted once cached.
+    def compile_ruby_code(code_sha, code)
+      return proc_cache[code_sha] if proc_cache.key?(code_sha)
+      
+      raise "Unknown code_sha: #{code_sha}" if code.nil? || code.empty?
+      raise "code_sha does not match code" unless Digest::SHA256.hexdigest(code) == code_sha
+      
+      proc_cache.shift if proc_cache.size >= PROC_CACHE_SIZE
+      proc_cache[code_sha] = eval("lambda {\n#{code}\n}", TOPLEVEL_BINDING.dup)
+    end
+    
     def eval_ruby(params)
-      log "Evaluating Ruby code with length: #{params['code'].length}"
+      code = params["code"] && decode_ruby_code(params["code"])
+      code_sha = params["code_sha"]
+      log "Evaluating Ruby code with length: #{code ? code.length : 0}, code_sha: #{code_sha.inspect}"
+      
+      # A digest sent without code that is no longer cached is an expected
+      # miss; the client resends the full code
+      if code_sha && (code.nil? || code.empty?) && !proc_cache.key?(code_sha)
+        log "Unknown code_sha: #{code_sha}"
+        return {
+          success: false,
+          error_code: "unknown_code_sha",
+          error: "Unknown code_sha: #{code_sha}"
+        }
+      end
       
       begin
-        # Create a safe binding for evaluation
-        binding = TOPLEVEL_BINDING.dup
-        
-        # Evaluate the Ruby code
         log "Starting code evaluation..."
-        result = eval(params["code"], binding)
+        if code_sha
+          # Run the cached compiled script
+          result = compile_ruby_code(code_sha, code).call
+        else
+          # Create a safe binding for evaluation
+          binding = TOPLEVEL_BINDING.dup
+          
+          # Evaluate the Ruby code
+          result = eval(code, binding)
+        end
         log "Code evaluation completed with result: #{result.inspect}"
         
         # Return success with the result as a string
         { 
           success: true,
-          result: result.to_s
+          result: result.to_s,
+          inflated: params["code"].to_s.start_with?(GZ64_MARKER)
         }
       rescue StandardError => e
         log "Error in eval_ruby: #{e.message}"
@@ -1,26 +1,34 @@
 import json
+import functools
 from dataclasses import dataclass
 
 @dataclass
 class MockContext:
     request_id: int = 1
 
-# Import the function we want to test
-from sketchup_mcp.server import eval_ruby
+@functools.lru_cache(maxsize=128)
+def _parse(result):
+    """Parse a result string once, keeping its pretty-printed form alongside it"""
+    parsed = json.loads(result)
+    return parsed, json.dumps(parsed, indent=2)
 
 # Test with a simple Ruby script
 test_code = '''
 model = Sketchup.active_model
 entities = model.active_entities
 line = entities.add_line([0,0,0], [100,100,100])
-puts "Created line with ID: #{line.entityID}"
 line.entityID
 '''
 
-# Call the function
-result = eval_ruby(MockContext(), test_code)
-print(f"Result: {result}")
+if __name__ == "__main__":
+    # Import the function we want to test here, so collecting this file
+    # doesn't pull in the MCP server and its logging setup
+    from sketchup_mcp.server import eval_ruby
 
-# Parse the result
-parsed = json.loads(result)
-print(f"Parsed: {json.dumps(parsed, indent=2)}") 
\ No newline at end of file
+    # Call the function
+    result = eval_ruby(MockContext(), test_code)
+    print(f"Result: {result}")
+
+    # Parse the result
+    parsed, pretty = _parse(result)
+    print(f"Parsed: {pretty}")